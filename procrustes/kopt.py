@@ -93,12 +93,14 @@ def kopt_heuristic_single(
         search = False
         # make sure p0 guess is the best permutation matrix found thus far
         p0 = np.copy(p_opt)
+        index = np.arange(p0.shape[0])
         for perm in it.permutations(np.arange(p0.shape[0]), r=int(k)):
             comb = tuple(sorted(perm))
             if perm != comb:
-                # row-swap P matrix & compute objective function
-                perm_p = np.copy(p0)
-                perm_p[:, comb] = perm_p[:, perm]
+                # column-swap P matrix in a single gather (instead of copy & re-assignment)
+                cols = np.copy(index)
+                cols[list(comb)] = perm
+                perm_p = p0[:, cols]
                 # compute objective function for permuted P matrix & compare
                 perm_f = fun(perm_p)
                 if perm_f < f_opt:
@@ -190,17 +192,21 @@ def kopt_heuristic_double(
         search = False
         # make sure p1 & p2 guesses are the best permutation matrices found thus far
         p1, p2 = np.copy(p1_opt), np.copy(p2_opt)
+        index1, index2 = np.arange(p1.shape[0]), np.arange(p2.shape[0])
         for perm1 in it.permutations(np.arange(p1.shape[0]), r=int(min(k, p1.shape[0]))):
             comb1 = tuple(sorted(perm1))
+            # permute rows of matrix P1 in a single gather; this only depends on perm1, so it is
+            # hoisted out of the inner loop over perm2
+            rows1 = np.copy(index1)
+            rows1[list(comb1)] = perm1
+            perm_p1 = p1[rows1, :]
             for perm2 in it.permutations(np.arange(p2.shape[0]), r=int(min(k, p2.shape[0]))):
                 comb2 = tuple(sorted(perm2))
                 if not (perm1 == comb1 and perm2 == comb2):
-                    # permute rows of matrix P1
-                    perm_p1 = np.copy(p1)
-                    perm_p1[comb1, :] = perm_p1[perm1, :]
-                    # permute rows of matrix P2
-                    perm_p2 = np.copy(p2)
-                    perm_p2[comb2, :] = perm_p2[perm2, :]
+                    # permute rows of matrix P2 in a single gather
+                    rows2 = np.copy(index2)
+                    rows2[list(comb2)] = perm2
+                    perm_p2 = p2[rows2, :]
                     # compute objective function for permuted P matrix & compare
                     perm_f = fun(perm_p1, perm_p2)
                     if perm_f < f_opt:
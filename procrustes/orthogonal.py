@@ -159,8 +159,11 @@ def orthogonal(
             f"Shape of A and B does not match: {new_a.shape} != {new_b.shape} "
             "Check pad, unpad_col, and unpad_row arguments."
         )
-    # calculate SVD of A.T * B
-    u, _, vt = scipy.linalg.svd(np.dot(new_a.T, new_b), lapack_driver=lapack_driver)
+    # calculate SVD of A.T * B; the product is a throwaway temporary, so LAPACK
+    # is free to overwrite it instead of making an internal copy
+    u, _, vt = scipy.linalg.svd(
+        np.dot(new_a.T, new_b), overwrite_a=True, lapack_driver=lapack_driver
+    )
     # compute optimal orthogonal transformation
     u_opt = np.dot(u, vt)
     # compute one-sided error
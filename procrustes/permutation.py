@@ -689,8 +689,9 @@ def _approx_permutation_2sided_1trans_umeyama_svd(
 ) -> np.ndarray:
     # compute u_umeyama
     perm = _approx_permutation_2sided_1trans_umeyama(a, b)
-    # compute approximated umeyama matrix
-    u, _, vt = scipy.linalg.svd(perm, lapack_driver=lapack_driver)
+    # compute approximated umeyama matrix; perm is a throwaway temporary, so
+    # LAPACK is free to overwrite it instead of making an internal copy
+    u, _, vt = scipy.linalg.svd(perm, overwrite_a=True, lapack_driver=lapack_driver)
     u_umeyama_approx = np.dot(np.abs(u), np.abs(vt))
     return u_umeyama_approx
 
@@ -391,20 +391,22 @@ def psdp_peng(
     sigma = np.diag(singular_values)
 
     # Representing the intermediate matrix S.
-    phi = np.array(
-        [[1 / (i**2 + j**2) for i in singular_values] for j in singular_values]
-    )
+    sv_sq = singular_values * singular_values
+    phi = 1.0 / np.add.outer(sv_sq, sv_sq)
     s = np.multiply(
         phi, multi_dot([u1.T, f, v1, sigma]) + multi_dot([sigma, v1.T, f.T, u1])
     )
 
     # Perform Spectral Decomposition on S (here named s).
-    eigenvalues, unitary = np.linalg.eig(s)
+    # S is symmetric by construction, so the symmetric eigensolver applies and
+    # returns real eigenvalues and eigenvectors directly.
+    eigenvalues, unitary = np.linalg.eigh(s)
     eigenvalues_pos = [max(0, i) for i in eigenvalues]
 
     # Computing intermediate matrices required to construct the required
     # optimal transformation.
-    p11 = multi_dot([unitary, np.diag(eigenvalues_pos), np.linalg.inv(unitary)])
+    # unitary is orthogonal (returned by eigh), so its inverse is its transpose
+    p11 = multi_dot([unitary, np.diag(eigenvalues_pos), unitary.T])
     p12 = multi_dot([np.linalg.inv(sigma), v1.T, f.T, u2])
 
     # Checking if solution is possible.
@@ -601,7 +603,7 @@ def psdp_woodgate(
 
         # Check if positive semidefinite or if the algorithm has converged.
         if (
-            np.all(np.linalg.eigvals(le) >= 0)
+            np.all(np.linalg.eigvalsh(le) >= 0)
             or abs(sqrt(error[-1]) - sqrt(error[-2])) < 1e-5
         ):
             break
@@ -668,10 +670,12 @@ def _make_positive(arr: np.ndarray) -> np.ndarray:
     np.ndarray
         The re-constructed matrix.
     """
-    eigenvalues, unitary = np.linalg.eig(arr)
+    # arr is symmetric at every call site, so the symmetric eigensolver applies
+    # and returns real eigenvalues and eigenvectors directly.
+    eigenvalues, unitary = np.linalg.eigh(arr)
     eigenvalues_pos = [max(0, i) for i in eigenvalues]
-    unitary_inv = np.linalg.inv(unitary)
-    return np.dot(unitary, np.dot(np.diag(eigenvalues_pos), unitary_inv))
+    # unitary is orthogonal (returned by eigh), so its inverse is its transpose
+    return np.dot(unitary, np.dot(np.diag(eigenvalues_pos), unitary.T))
 
 
 def _find_gradient(e: np.ndarray, le: np.ndarray, g: np.ndarray) -> np.ndarray:
@@ -178,8 +178,11 @@ def rotational(
             f"Shape of A and B does not match: {new_a.shape} != {new_b.shape} "
             "Check pad, unpad_col, and unpad_row arguments."
         )
-    # compute SVD of A.T * B
-    u, _, vt = scipy.linalg.svd(np.dot(new_a.T, new_b), lapack_driver=lapack_driver)
+    # compute SVD of A.T * B; the product is a throwaway temporary, so LAPACK
+    # is free to overwrite it instead of making an internal copy
+    u, _, vt = scipy.linalg.svd(
+        np.dot(new_a.T, new_b), overwrite_a=True, lapack_driver=lapack_driver
+    )
     # construct S: an identity matrix with the smallest singular value replaced by sgn(|U*V^t|)
     s = np.eye(new_a.shape[1])
     s[-1, -1] = np.sign(np.linalg.det(np.dot(u, vt)))
@@ -195,10 +195,13 @@ def symmetric(
     # compute intermediate matrix Y
     n = new_a.shape[1]
     y = np.zeros((n, n))
+    # hoist the squared singular values out of the loop; multiplication avoids
+    # the scalar power path of ** on every element
+    s_sq = s * s
     for i in range(n):
         for j in range(n):
-            if s[i] ** 2 + s[j] ** 2 != 0:
-                y[i, j] = (s[i] * c[i, j] + s[j] * c[j, i]) / (s[i] ** 2 + s[j] ** 2)
+            if s_sq[i] + s_sq[j] != 0:
+                y[i, j] = (s[i] * c[i, j] + s[j] * c[j, i]) / (s_sq[i] + s_sq[j])
 
     # compute optimum symmetric transformation matrix X
     x = np.dot(np.dot(vt.T, y), vt)
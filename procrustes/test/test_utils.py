@@ -23,21 +23,22 @@
 """Utils module for Procrustes."""
 
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_raises
+from numpy.testing import assert_allclose, assert_raises
 from procrustes.utils import _hide_zero_padding, _scale_array, _translate_array, _zero_padding
+import pytest
 
 
 def test_zero_padding_rows():
     r"""Test _zero_padding with random array padding rows."""
-    array1 = np.array([[1, 2], [3, 4]])
-    array2 = np.array([[5, 6]])
+    array1 = np.array([[1, 2], [3, 4]], dtype=int)
+    array2 = np.array([[5, 6]], dtype=int)
 
     # match the number of rows of the 1st array
     padded2, padded1 = _zero_padding(array2, array1, pad_mode="row")
     assert padded1.shape == (2, 2)
     assert padded2.shape == (2, 2)
-    assert (abs(padded1 - array1) < 1.0e-10).all()
-    assert (abs(padded2 - np.array([[5, 6], [0, 0]])) < 1.0e-10).all()
+    assert np.array_equal(padded1, array1)
+    assert np.array_equal(padded2, np.array([[5, 6], [0, 0]], dtype=int))
 
     # match the number of rows of the 1st array
     array3 = np.arange(8).reshape(2, 4)
@@ -45,33 +46,23 @@ def test_zero_padding_rows():
     padded3, padded4 = _zero_padding(array3, array4, pad_mode="row")
     assert padded3.shape == (4, 4)
     assert padded4.shape == (4, 2)
-    assert (abs(array4 - padded4) < 1.0e-10).all()
-    expected = list(range(8))
-    expected.extend([0] * 8)
-    expected = np.array(expected).reshape(4, 4)
-    assert (abs(expected - padded3) < 1.0e-10).all()
-
-    # padding the padded_arrays should not change anything
-    padded5, padded6 = _zero_padding(padded3, padded4, pad_mode="row")
-    assert padded3.shape == (4, 4)
-    assert padded4.shape == (4, 2)
-    assert padded5.shape == (4, 4)
-    assert padded6.shape == (4, 2)
-    assert (abs(padded5 - padded3) < 1.0e-10).all()
-    assert (abs(padded6 - padded4) < 1.0e-10).all()
+    assert np.array_equal(array4, padded4)
+    expected = np.zeros((4, 4), dtype=int)
+    expected[:2] = np.arange(8).reshape(2, 4)
+    assert np.array_equal(expected, padded3)
 
 
 def test_zero_padding_columns():
     r"""Test _zero_padding with random array padding columns."""
-    array1 = np.array([[4, 7, 2], [1, 3, 5]])
-    array2 = np.array([[5], [2]])
+    array1 = np.array([[4, 7, 2], [1, 3, 5]], dtype=int)
+    array2 = np.array([[5], [2]], dtype=int)
 
     # match the number of columns of the 1st array
     padded2, padded1 = _zero_padding(array2, array1, pad_mode="col")
     assert padded1.shape == (2, 3)
     assert padded2.shape == (2, 3)
-    assert (abs(padded1 - array1) < 1.0e-10).all()
-    assert (abs(padded2 - np.array([[5, 0, 0], [2, 0, 0]])) < 1.0e-10).all()
+    assert np.array_equal(padded1, array1)
+    assert np.array_equal(padded2, np.array([[5, 0, 0], [2, 0, 0]], dtype=int))
 
     # match the number of columns of the 1st array
     array3 = np.arange(8).reshape(8, 1)
@@ -79,36 +70,40 @@ def test_zero_padding_columns():
     padded3, padded4 = _zero_padding(array3, array4, pad_mode="col")
     assert padded3.shape == (8, 4)
     assert padded4.shape == (2, 4)
-    assert (abs(array4 - padded4) < 1.0e-10).all()
-    expected = list(range(8))
-    expected.extend([0] * 24)
-    expected = np.array(expected).reshape(4, 8).T
-    assert (abs(expected - padded3) < 1.0e-10).all()
-
-    # padding the padded_arrays should not change anything
-    padded5, padded6 = _zero_padding(padded3, padded4, pad_mode="col")
-    assert padded3.shape == (8, 4)
-    assert padded4.shape == (2, 4)
-    assert padded5.shape == (8, 4)
-    assert padded6.shape == (2, 4)
-    assert (abs(padded5 - padded3) < 1.0e-10).all()
-    assert (abs(padded6 - padded4) < 1.0e-10).all()
+    assert np.array_equal(array4, padded4)
+    expected = np.zeros((8, 4), dtype=int)
+    expected[:, 0] = np.arange(8)
+    assert np.array_equal(expected, padded3)
+
+
+@pytest.mark.parametrize("pad_mode", ["row", "col", "row-col", "square"])
+def test_zero_padding_idempotent(pad_mode):
+    r"""Test that _zero_padding of already-padded arrays does not change them."""
+    array1 = np.arange(8, dtype=float).reshape(2, 4)
+    array2 = np.arange(6, dtype=float).reshape(3, 2)
+    padded1, padded2 = _zero_padding(array1, array2, pad_mode=pad_mode)
+    # padding the padded arrays should not change anything
+    repadded1, repadded2 = _zero_padding(padded1, padded2, pad_mode=pad_mode)
+    assert repadded1.shape == padded1.shape
+    assert repadded2.shape == padded2.shape
+    assert np.allclose(repadded1, padded1, rtol=0, atol=1.0e-10)
+    assert np.allclose(repadded2, padded2, rtol=0, atol=1.0e-10)
 
 
 def test_zero_padding_rows_columns():
     r"""Test _zero_padding with random array padding rows and columns."""
-    array1 = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]])
-    array2 = np.array([[1, 2.5], [9, 5], [4, 8.5]])
+    array1 = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]], dtype=int)
+    array2 = np.array([[1, 2.5], [9, 5], [4, 8.5]], dtype=float)
 
     padded2, padded1 = _zero_padding(array2, array1, pad_mode="row-col")
-    array2_test = np.array([[1, 2.5, 0], [9, 5, 0], [4, 8.5, 0], [0, 0, 0]])
+    array2_test = np.array([[1, 2.5, 0], [9, 5, 0], [4, 8.5, 0], [0, 0, 0]], dtype=float)
     assert padded1.shape == (4, 3)
     assert padded2.shape == (4, 3)
-    assert (abs(padded1 - array1) < 1.0e-10).all()
-    assert (abs(padded2 - array2_test) < 1.0e-10).all()
+    assert np.allclose(padded1, array1, rtol=0, atol=1.0e-10)
+    assert np.allclose(padded2, array2_test, rtol=0, atol=1.0e-10)
 
     # Test in the scenario they have the same shape but fat rectangular.
-    array1 = np.array([[60, 85, 86, 1.0], [85, 151, 153, 2.0], [86, 153, 158, 10.0]])
+    array1 = np.array([[60, 85, 86, 1.0], [85, 151, 153, 2.0], [86, 153, 158, 10.0]], dtype=float)
     padded2, padded1 = _zero_padding(array1, array1, pad_mode="row-col")
     assert np.all(np.abs(array1 - padded2)) < 1e-5
     assert np.all(np.abs(array1 - padded1)) < 1e-5
@@ -128,79 +123,81 @@ def test_zero_padding_rows_columns():
 def test_zero_padding_square():
     r"""Test _zero_padding with squared array."""
     # Try two equivalent (but different sized) symmetric arrays
-    array1 = np.array([[60, 85, 86], [85, 151, 153], [86, 153, 158]])
+    array1 = np.array([[60, 85, 86], [85, 151, 153], [86, 153, 158]], dtype=int)
     array2 = np.array(
-        [[60, 85, 86, 0, 0], [85, 151, 153, 0, 0], [86, 153, 158, 0, 0], [0, 0, 0, 0, 0]]
+        [[60, 85, 86, 0, 0], [85, 151, 153, 0, 0], [86, 153, 158, 0, 0], [0, 0, 0, 0, 0]], dtype=int
     )
     square1, square2 = _zero_padding(array1, array2, pad_mode="square")
     assert square1.shape == square2.shape
     assert square1.shape[0] == square1.shape[1]
 
     # Test in the scenario they have the same shape but rectangular.
-    array1 = np.array([[60, 85, 86, 1.0], [85, 151, 153, 2.0], [86, 153, 158, 10.0]])
-    array2 = np.array([[60, 85, 86, 1.0], [85, 151, 153, 2.0], [86, 153, 158, 10.0]])
+    array1 = np.array([[60, 85, 86, 1.0], [85, 151, 153, 2.0], [86, 153, 158, 10.0]], dtype=float)
+    array2 = np.array([[60, 85, 86, 1.0], [85, 151, 153, 2.0], [86, 153, 158, 10.0]], dtype=float)
     square1, square2 = _zero_padding(array1, array2, pad_mode="square")
     assert square1.shape == square2.shape
     assert square1.shape[0] == square1.shape[1]
     assert square1.shape[0] == 4
 
     # Performing the analysis on equally sized square arrays should return the same input arrays
-    sym_part = np.array([[1, 7, 8, 4], [6, 4, 8, 1]])
+    sym_part = np.array([[1, 7, 8, 4], [6, 4, 8, 1]], dtype=int)
     array1 = np.dot(sym_part, sym_part.T)
     array2 = array1
     assert array1.shape == array2.shape
     square1, square2 = _zero_padding(array1, array2, pad_mode="square")
     assert square1.shape == square2.shape
     assert square1.shape[0] == square1.shape[1]
-    assert (abs(array2 - array1) < 1.0e-10).all()
+    assert np.array_equal(array2, array1)
 
 
 def test_hide_zero_padding_flat():
     r"""Test _hide_zero_padding with flat array."""
-    array0 = np.array([0, 1, 5, 8, 0, 1])
+    array0 = np.array([0, 1, 5, 8, 0, 1], dtype=int)
     # check array with no padding
-    np.testing.assert_almost_equal(_hide_zero_padding(array0), array0, decimal=6)
-    array1 = np.array([0, 1, 5, 8, 0, 1, 0])
-    np.testing.assert_almost_equal(_hide_zero_padding(array1), array0, decimal=6)
-    array2 = np.array([0, 1, 5, 8, 0, 1, 0, 0, 0, 0])
-    np.testing.assert_almost_equal(_hide_zero_padding(array2), array0, decimal=6)
+    np.testing.assert_allclose(_hide_zero_padding(array0), array0, rtol=0, atol=1.5e-6)
+    array1 = np.array([0, 1, 5, 8, 0, 1, 0], dtype=int)
+    np.testing.assert_allclose(_hide_zero_padding(array1), array0, rtol=0, atol=1.5e-6)
+    array2 = np.array([0, 1, 5, 8, 0, 1, 0, 0, 0, 0], dtype=int)
+    np.testing.assert_allclose(_hide_zero_padding(array2), array0, rtol=0, atol=1.5e-6)
 
 
 def test_hide_zero_padding_rectangular():
     r"""Test _hide_zero_padding by array with redundant row of zeros."""
-    array0 = np.array([[1, 6, 0, 7, 8], [5, 7, 0, 22, 7]])
+    array0 = np.array([[1, 6, 0, 7, 8], [5, 7, 0, 22, 7]], dtype=int)
     # check array with no padding
-    np.testing.assert_almost_equal(_hide_zero_padding(array0), array0, decimal=6)
+    np.testing.assert_allclose(_hide_zero_padding(array0), array0, rtol=0, atol=1.5e-6)
     # check row-padded arrays
-    array1 = np.array([[1, 6, 0, 7, 8], [5, 7, 0, 22, 7], [0, 0, 0, 0, 0]])
-    np.testing.assert_almost_equal(_hide_zero_padding(array1), array0, decimal=6)
-    array2 = np.array([[1, 6, 0, 7, 8], [5, 7, 0, 22, 7], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]])
-    np.testing.assert_almost_equal(_hide_zero_padding(array2), array0, decimal=6)
+    array1 = np.array([[1, 6, 0, 7, 8], [5, 7, 0, 22, 7], [0, 0, 0, 0, 0]], dtype=int)
+    np.testing.assert_allclose(_hide_zero_padding(array1), array0, rtol=0, atol=1.5e-6)
+    array2 = np.array(
+        [[1, 6, 0, 7, 8], [5, 7, 0, 22, 7], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]], dtype=int
+    )
+    np.testing.assert_allclose(_hide_zero_padding(array2), array0, rtol=0, atol=1.5e-6)
     # check column-padded arrays
-    array3 = np.array([[1, 6, 0, 7, 8, 0], [5, 7, 0, 22, 7, 0]])
-    np.testing.assert_almost_equal(_hide_zero_padding(array3), array0, decimal=6)
-    array4 = np.array([[1, 6, 0, 7, 8, 0, 0, 0], [5, 7, 0, 22, 7, 0, 0, 0]])
-    np.testing.assert_almost_equal(_hide_zero_padding(array4), array0, decimal=6)
+    array3 = np.array([[1, 6, 0, 7, 8, 0], [5, 7, 0, 22, 7, 0]], dtype=int)
+    np.testing.assert_allclose(_hide_zero_padding(array3), array0, rtol=0, atol=1.5e-6)
+    array4 = np.array([[1, 6, 0, 7, 8, 0, 0, 0], [5, 7, 0, 22, 7, 0, 0, 0]], dtype=int)
+    np.testing.assert_allclose(_hide_zero_padding(array4), array0, rtol=0, atol=1.5e-6)
     # check row- and column-padded arrays
     array5 = np.array(
-        [[1, 6, 0, 7, 8, 0, 0, 0], [5, 7, 0, 22, 7, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0]]
+        [[1, 6, 0, 7, 8, 0, 0, 0], [5, 7, 0, 22, 7, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0]], dtype=int
     )
-    np.testing.assert_almost_equal(_hide_zero_padding(array5), array0, decimal=6)
+    np.testing.assert_allclose(_hide_zero_padding(array5), array0, rtol=0, atol=1.5e-6)
 
 
 def test_hide_zero_padding_square():
     r"""Test _hide_zero_padding with squared array."""
-    array0 = np.array([[0, 0.5, 1.0], [0, 3.1, 4.6], [0, 7.2, 9.2]])
+    array0 = np.array([[0, 0.5, 1.0], [0, 3.1, 4.6], [0, 7.2, 9.2]], dtype=float)
     # check array with no padding
-    np.testing.assert_almost_equal(_hide_zero_padding(array0), array0, decimal=6)
+    np.testing.assert_allclose(_hide_zero_padding(array0), array0, rtol=0, atol=1.5e-6)
     # check row-padded arrays
-    array1 = np.array([[0, 0.5, 1.0], [0, 3.1, 4.6], [0, 7.2, 9.2], [0.0, 0.0, 0.0]])
-    np.testing.assert_almost_equal(_hide_zero_padding(array1), array0, decimal=6)
+    array1 = np.array([[0, 0.5, 1.0], [0, 3.1, 4.6], [0, 7.2, 9.2], [0.0, 0.0, 0.0]], dtype=float)
+    np.testing.assert_allclose(_hide_zero_padding(array1), array0, rtol=0, atol=1.5e-6)
     # check column-padded arrays
-    array2 = np.array([[0, 0.5, 1.0, 0], [0, 3.1, 4.6, 0], [0, 7.2, 9.2, 0]])
-    np.testing.assert_almost_equal(_hide_zero_padding(array2), array0, decimal=6)
-    array3 = np.array([[0, 0.5, 1.0, 0, 0], [0, 3.1, 4.6, 0, 0], [0, 7.2, 9.2, 0, 0]])
-    np.testing.assert_almost_equal(_hide_zero_padding(array3), array0, decimal=6)
+    array2 = np.array([[0, 0.5, 1.0, 0], [0, 3.1, 4.6, 0], [0, 7.2, 9.2, 0]], dtype=float)
+    np.testing.assert_allclose(_hide_zero_padding(array2), array0, rtol=0, atol=1.5e-6)
+    array3 = np.array([[0, 0.5, 1.0, 0, 0], [0, 3.1, 4.6, 0, 0], [0, 7.2, 9.2, 0, 0]], dtype=float)
+    np.testing.assert_allclose(_hide_zero_padding(array3), array0, rtol=0, atol=1.5e-6)
     # check row- and column-padded arrays
     array4 = np.array(
         [
@@ -209,9 +206,9 @@ def test_hide_zero_padding_square():
             [0, 7.2, 9.2, 0, 0],
             [0, 0.0, 0.0, 0, 0],
             [0, 0.0, 0.0, 0, 0],
-        ]
+        ], dtype=float
     )
-    np.testing.assert_almost_equal(_hide_zero_padding(array4), array0, decimal=6)
+    np.testing.assert_allclose(_hide_zero_padding(array4), array0, rtol=0, atol=1.5e-6)
     # check with close to zero values.
     array4 = np.array(
         [
@@ -220,56 +217,59 @@ def test_hide_zero_padding_square():
             [0, 7.2, 9.2, 1e-5, 1e-9],
             [0, 0.0, 0.0, 0.0, 1e-8],
             [0, 0.0, 0.0, 0.0, 0],
-        ]
+        ], dtype=float
     )
-    actual = np.array([[0, 0.5, 1.0, 1e-6], [0.0, 3.1, 4.6, 1e-6], [0.0, 7.2, 9.2, 1e-5]])
-    np.testing.assert_almost_equal(_hide_zero_padding(array4), actual, decimal=6)
+    actual = np.array(
+        [[0, 0.5, 1.0, 1e-6], [0.0, 3.1, 4.6, 1e-6], [0.0, 7.2, 9.2, 1e-5]], dtype=float
+    )
+    np.testing.assert_allclose(_hide_zero_padding(array4), actual, rtol=0, atol=1.5e-6)
 
 
 def test_translate_array():
     r"""Test _translate_array with random array."""
-    array_translated = np.array([[2, 4, 6, 10], [1, 3, 7, 0], [3, 6, 9, 4]])
+    array_translated = np.array([[2, 4, 6, 10], [1, 3, 7, 0], [3, 6, 9, 4]], dtype=int)
     # Find the means over each dimension
-    column_means_translated = np.zeros(4)
-    for i in range(4):
-        column_means_translated[i] = np.mean(array_translated[:, i])
+    column_means_translated = array_translated.mean(axis=0)
     # Confirm that these means are not all zero
     assert (abs(column_means_translated) > 1.0e-8).all()
     # Compute the origin-centred array
     origin_centred_array, _ = _translate_array(array_translated)
     # Confirm that the column means of the origin-centred array are all zero
-    column_means_centred = np.ones(4)
-    for i in range(4):
-        column_means_centred[i] = np.mean(origin_centred_array[:, i])
+    column_means_centred = origin_centred_array.mean(axis=0)
     assert (abs(column_means_centred) < 1.0e-10).all()
 
     # translating a centered array does not do anything
     centred_sphere = 25.25 * np.array(
-        [[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, 0, 0], [0, -1, 0], [0, 0, -1]]
+        [[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, 0, 0], [0, -1, 0], [0, 0, -1]], dtype=int
     )
     predicted, _ = _translate_array(centred_sphere)
     expected = centred_sphere
-    assert (abs(predicted - expected) < 1.0e-8).all()
+    assert np.allclose(predicted, expected, rtol=0, atol=1.0e-8)
 
     # centering a translated unit sphere dose not do anything
-    shift = np.array([[1, 4, 5], [1, 4, 5], [1, 4, 5], [1, 4, 5], [1, 4, 5], [1, 4, 5]])
+    shift = np.array(
+        [[1, 4, 5], [1, 4, 5], [1, 4, 5], [1, 4, 5], [1, 4, 5], [1, 4, 5]], dtype=int
+    )
     translated_sphere = (
-        np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, 0, 0], [0, -1, 0], [0, 0, -1]]) + shift
+        np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, 0, 0], [0, -1, 0], [0, 0, -1]], dtype=int)
+        + shift
     )
     predicted, _ = _translate_array(translated_sphere)
-    expected = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, 0, 0], [0, -1, 0], [0, 0, -1]])
-    assert (abs(predicted - expected) < 1.0e-8).all()
+    expected = np.array(
+        [[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, 0, 0], [0, -1, 0], [0, 0, -1]], dtype=int
+    )
+    assert np.allclose(predicted, expected, rtol=0, atol=1.0e-8)
     # If an arbitrary array is centroid translated, the analysis applied to the original array
     # and the translated array should give identical results
     # Define an arbitrary array
-    array_a = np.array([[1, 5, 7], [8, 4, 6]])
+    array_a = np.array([[1, 5, 7], [8, 4, 6]], dtype=int)
     # Define an arbitrary translation
-    translate = np.array([[5, 8, 9], [5, 8, 9]])
+    translate = np.array([[5, 8, 9], [5, 8, 9]], dtype=int)
     # Define the translated original array
     array_translated = array_a + translate
     # Begin translation analysis
     centroid_a_to_b, _ = _translate_array(array_a, array_translated)
-    assert (abs(centroid_a_to_b - array_translated) < 1.0e-10).all()
+    assert np.allclose(centroid_a_to_b, array_translated, rtol=0, atol=1.0e-10)
 
 
 def test_translate_weight():
@@ -283,7 +283,7 @@ def test_translate_weight():
     # center the data points to mass of center
     arr_centered = arr - col_sum / weight.sum()
     array_a_centered, _ = _translate_array(array_a=arr, array_b=None, weight=weight)
-    assert_almost_equal(arr_centered, array_a_centered)
+    assert_allclose(arr_centered, array_a_centered, rtol=0, atol=1.5e-7)
 
 
 def test_translate_invalid():
@@ -293,54 +293,56 @@ def test_translate_invalid():
     weight1 = np.arange(1, 5).reshape(-1, 1)
     # array_a, array_b=None, weight=None
     assert_raises(ValueError, _translate_array, arr, None, weight1)
-    weight2 = np.array([-1, 1, 3, 4])
+    weight2 = np.array([-1, 1, 3, 4], dtype=int)
     assert_raises(ValueError, _translate_array, arr, None, weight2)
 
 
 def test_scale_array():
     r"""Test _scale_array with random array."""
     # Rescale arbitrary array
-    array_a = np.array([[6, 2, 1], [5, 2, 9], [8, 6, 4]])
+    array_a = np.array([[6, 2, 1], [5, 2, 9], [8, 6, 4]], dtype=int)
     # Confirm Frobenius normaliation has transformed the array to lie on the unit sphere in
     # the R^(mxn) vector space. We must centre the array about the origin before proceeding
     array_a, _ = _translate_array(array_a)
     # Confirm proper centering
-    column_means_centred = np.zeros(3)
-    for i in range(3):
-        column_means_centred[i] = np.mean(array_a[:, i])
+    column_means_centred = array_a.mean(axis=0)
     assert (abs(column_means_centred) < 1.0e-10).all()
     # Proceed with Frobenius normalization
     scaled_array, _ = _scale_array(array_a)
     # Confirm array has unit norm
-    assert abs(np.sqrt((scaled_array ** 2.0).sum()) - 1.0) < 1.0e-10
+    assert abs(np.linalg.norm(scaled_array) - 1.0) < 1.0e-10
     # This test verifies that when _scale_array is applied to two scaled unit spheres,
     # the Frobenius norm of each new sphere is unity.
     # Rescale spheres to unitary scale
     # Define arbitrarily scaled unit spheres
-    unit_sphere = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, 0, 0], [0, -1, 0], [0, 0, -1]])
+    unit_sphere = np.array(
+        [[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, 0, 0], [0, -1, 0], [0, 0, -1]], dtype=int
+    )
     sphere_1 = 230.15 * unit_sphere
     sphere_2 = 0.06 * unit_sphere
     # Proceed with scaling procedure
     scaled1, _ = _scale_array(sphere_1)
     scaled2, _ = _scale_array(sphere_2)
     # Confirm each scaled array has unit Frobenius norm
-    assert abs(np.sqrt((scaled1 ** 2.0).sum()) - 1.0) < 1.0e-10
-    assert abs(np.sqrt((scaled2 ** 2.0).sum()) - 1.0) < 1.0e-10
+    assert abs(np.linalg.norm(scaled1) - 1.0) < 1.0e-10
+    assert abs(np.linalg.norm(scaled2) - 1.0) < 1.0e-10
     # If an arbitrary array is scaled, the scaling analysis should be able to recreate the scaled
     # array from the original
     # applied to the original array and the scaled array should give identical results.
     # Define an arbitrary array
-    array_a = np.array([[1, 5, 7], [8, 4, 6]])
+    array_a = np.array([[1, 5, 7], [8, 4, 6]], dtype=int)
     # Define an arbitrary scaling factor
     scale = 6.3
     # Define the scaled original array
     array_scaled = scale * array_a
     # Begin scaling analysis
     scaled_a, _ = _scale_array(array_a, array_scaled)
-    assert (abs(scaled_a - array_scaled) < 1.0e-10).all()
+    assert np.allclose(scaled_a, array_scaled, rtol=0, atol=1.0e-10)
 
     # Define an arbitrary array
-    array_a = np.array([[6.0, 12.0, 16.0, 7.0], [4.0, 16.0, 17.0, 33.0], [5.0, 17.0, 12.0, 16.0]])
+    array_a = np.array(
+        [[6.0, 12.0, 16.0, 7.0], [4.0, 16.0, 17.0, 33.0], [5.0, 17.0, 12.0, 16.0]], dtype=float
+    )
     # Define the scaled original array
     array_scale = 123.45 * array_a
     # Verify the validity of the translate_scale analysis
@@ -348,4 +350,20 @@ def test_scale_array():
     predicted, _ = _scale_array(array_scale, array_a)
     # array_trans_scale should be identical to array after the above analysis
     expected = array_a
-    assert (abs(predicted - expected) < 1.0e-10).all()
+    assert np.allclose(predicted, expected, rtol=0, atol=1.0e-10)
+
+
+def test_translate_scale_array_out():
+    r"""Test _translate_array and _scale_array writing into an out= buffer."""
+    array_a = np.array([[6, 2, 1], [5, 2, 9], [8, 6, 4]], dtype=float)
+    # passing out=array_a performs the translation fully in place
+    expected, _ = _translate_array(np.copy(array_a))
+    translated, _ = _translate_array(array_a, out=array_a)
+    assert translated is array_a
+    assert_allclose(translated, expected, rtol=0, atol=1.0e-10)
+    # passing out=array_a performs the scaling fully in place & matches out=None
+    expected, expected_scale = _scale_array(np.copy(array_a))
+    scaled, scale = _scale_array(array_a, out=array_a)
+    assert scaled is array_a
+    assert scale == expected_scale
+    assert_allclose(scaled, expected, rtol=0, atol=1.0e-10)
@@ -24,6 +24,7 @@
 from typing import List, Optional, Tuple
 
 import numpy as np
+from numpy.linalg import multi_dot
 
 __all__ = [
     "compute_error",
@@ -32,6 +33,58 @@ __all__ = [
 ]
 
 
+def _pad_rows(array_a: np.ndarray, array_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Pad the array with fewer rows with zero rows, so both have the same number of rows."""
+    diff = array_a.shape[0] - array_b.shape[0]
+    if diff < 0:
+        array_a = np.pad(array_a, [[0, -diff], [0, 0]], "constant", constant_values=0)
+    else:
+        array_b = np.pad(array_b, [[0, diff], [0, 0]], "constant", constant_values=0)
+    return array_a, array_b
+
+
+def _pad_cols(array_a: np.ndarray, array_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Pad the array with fewer columns with zero columns, so both have the same number."""
+    diff = array_a.shape[1] - array_b.shape[1]
+    if diff < 0:
+        array_a = np.pad(array_a, [[0, 0], [0, -diff]], "constant", constant_values=0)
+    else:
+        array_b = np.pad(array_b, [[0, 0], [0, diff]], "constant", constant_values=0)
+    return array_a, array_b
+
+
+def _pad_rows_cols(array_a: np.ndarray, array_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Pad rows and columns with zeros, so both arrays have the same dimensions."""
+    return _pad_cols(*_pad_rows(array_a, array_b))
+
+
+def _pad_square(array_a: np.ndarray, array_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Pad both arrays with zero rows and columns, so both are square of the same dimension."""
+    # calculate desired dimension of square array
+    (a_n1, a_m1), (a_n2, a_m2) = array_a.shape, array_b.shape
+    dim = max(a_n1, a_n2, a_m1, a_m2)
+    # pad rows & columns in one shot, so each array is allocated and copied at most once
+    if a_n1 < dim or a_m1 < dim:
+        array_a = np.pad(
+            array_a, [[0, dim - a_n1], [0, dim - a_m1]], "constant", constant_values=0
+        )
+    if a_n2 < dim or a_m2 < dim:
+        array_b = np.pad(
+            array_b, [[0, dim - a_n2], [0, dim - a_m2]], "constant", constant_values=0
+        )
+    return array_a, array_b
+
+
+# dispatch table resolved at import time, so _zero_padding does a single dict lookup
+# per call instead of re-comparing the pad_mode string against every branch
+_PAD_MODES = {
+    "row": _pad_rows,
+    "col": _pad_cols,
+    "row-col": _pad_rows_cols,
+    "square": _pad_square,
+}
+
+
 def _zero_padding(
     array_a: np.ndarray, array_b: np.ndarray, pad_mode: str = "row-col"
 ) -> Tuple[np.ndarray, np.ndarray]:
@@ -79,42 +132,17 @@ def _zero_padding(
         # special case of square arrays, mode is set to None so that array_a & array_b are returned.
         pad_mode = None
 
-    if pad_mode == "square":
-        # calculate desired dimension of square array
-        (a_n1, a_m1), (a_n2, a_m2) = array_a.shape, array_b.shape
-        dim = max(a_n1, a_n2, a_m1, a_m2)
-        # padding rows to have both arrays have dim rows
-        if a_n1 < dim:
-            array_a = np.pad(array_a, [[0, dim - a_n1], [0, 0]], "constant", constant_values=0)
-        if a_n2 < dim:
-            array_b = np.pad(array_b, [[0, dim - a_n2], [0, 0]], "constant", constant_values=0)
-        # padding columns to have both arrays have dim columns
-        if a_m1 < dim:
-            array_a = np.pad(array_a, [[0, 0], [0, dim - a_m1]], "constant", constant_values=0)
-        if a_m2 < dim:
-            array_b = np.pad(array_b, [[0, 0], [0, dim - a_m2]], "constant", constant_values=0)
-
-    if pad_mode in ["row", "row-col"]:
-        # padding rows to have both arrays have the same number of rows
-        diff = array_a.shape[0] - array_b.shape[0]
-        if diff < 0:
-            array_a = np.pad(array_a, [[0, -diff], [0, 0]], "constant", constant_values=0)
-        else:
-            array_b = np.pad(array_b, [[0, diff], [0, 0]], "constant", constant_values=0)
-
-    if pad_mode in ["col", "row-col"]:
-        # padding columns to have both arrays have the same number of columns
-        diff = array_a.shape[1] - array_b.shape[1]
-        if diff < 0:
-            array_a = np.pad(array_a, [[0, 0], [0, -diff]], "constant", constant_values=0)
-        else:
-            array_b = np.pad(array_b, [[0, 0], [0, diff]], "constant", constant_values=0)
-
+    pad_func = _PAD_MODES.get(pad_mode)
+    if pad_func is not None:
+        array_a, array_b = pad_func(array_a, array_b)
     return array_a, array_b
 
 
 def _translate_array(
-    array_a: np.ndarray, array_b: Optional[np.ndarray] = None, weight: Optional[np.ndarray] = None
+    array_a: np.ndarray,
+    array_b: Optional[np.ndarray] = None,
+    weight: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None,
 ) -> Tuple[np.ndarray, float]:
     """
     Return translated array_a and translation vector.
@@ -129,6 +157,9 @@ def _translate_array(
         The 2D-array to translate array_a based on.
     weight : ndarray, optional
         The weight vector.
+    out : ndarray, optional
+        The buffer in which to store the translated array. If given, no new
+        array is allocated; pass array_a itself for a fully in-place update.
 
     Returns
     -------
@@ -147,15 +178,20 @@ def _translate_array(
             raise ValueError("The weight should be a 1d row vector.")
         if not (weight >= 0).all():
             raise ValueError("The elements of the weight should be non-negative.")
-
-    centroid_a = np.average(array_a, axis=0, weights=weight)
-    if array_b is not None:
-        # translation vector to b centroid
-        centroid_a -= np.average(array_b, axis=0, weights=weight)
-    return array_a - centroid_a, -1 * centroid_a
+        centroid_a = np.average(array_a, axis=0, weights=weight)
+        if array_b is not None:
+            # translation vector to b centroid
+            centroid_a -= np.average(array_b, axis=0, weights=weight)
+    else:
+        # fast path: plain column means skip np.average's weight handling
+        centroid_a = array_a.mean(axis=0)
+        if array_b is not None:
+            # translation vector to b centroid
+            centroid_a -= array_b.mean(axis=0)
+    return np.subtract(array_a, centroid_a, out=out), -centroid_a
 
 
-def _scale_array(array_a, array_b=None) -> Tuple[np.ndarray, float]:
+def _scale_array(array_a, array_b=None, out=None) -> Tuple[np.ndarray, float]:
     """
     Return scaled/normalized array_a and scaling vector.
 
@@ -165,6 +201,9 @@ def _scale_array(array_a, array_b=None) -> Tuple[np.ndarray, float]:
         The 2D-array to scale
     array_b : ndarray, default=None
         The 2D-array to scale array_a based on.
+    out : ndarray, optional
+        The buffer in which to store the scaled array. If given, no new array
+        is allocated; pass array_a itself for a fully in-place update.
 
     Returns
     -------
@@ -181,7 +220,42 @@ def _scale_array(array_a, array_b=None) -> Tuple[np.ndarray, float]:
     if array_b is not None:
         # scaling factor to match array_b norm
         scale *= np.linalg.norm(array_b)
-    return array_a * scale, scale
+    return np.multiply(array_a, scale, out=out), scale
+
+
+def _translate_scale_array(
+    array_a: np.ndarray, array_b: Optional[np.ndarray] = None, weight: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Return array_a translated and scaled/normalized in a fused pass.
+
+    Equivalent to _translate_array followed by _scale_array, but the centered
+    intermediate array is normalized in-place, so one full-matrix temporary
+    (and its extra memory pass) is avoided.
+
+    Parameters
+    ----------
+    array_a : ndarray
+        The 2D-array to translate and scale.
+    array_b : ndarray, optional
+        The 2D-array to translate and scale array_a based on.
+    weight : ndarray, optional
+        The weight vector used for the translation.
+
+    Returns
+    -------
+    array_a : ndarray
+        The translated and scaled/normalized array_a.
+    centroid : ndarray
+        The translation vector.
+    scale : float
+        The scaling factor.
+
+    """
+    # the translated array is a freshly allocated temporary, so it can be scaled in-place
+    array_a, centroid = _translate_array(array_a, array_b, weight)
+    array_a, scale = _scale_array(array_a, array_b, out=array_a)
+    return array_a, centroid, scale
 
 
 def _hide_zero_padding(
@@ -213,25 +287,17 @@ def _hide_zero_padding(
     # Input checking
     if array_a.ndim > 2:
         raise TypeError("Matrix inputs must be 1- or 2- dimensional arrays")
-    # Check zero rows from bottom to top
+    # Cut off zero rows (checked from bottom to top)
     if remove_zero_row:
-        num_row = array_a.shape[0]
-        tmp_a = array_a[..., np.newaxis] if array_a.ndim == 1 else array_a
-        for array_v in tmp_a[::-1]:
-            if any(abs(i) > tol for i in array_v):
-                break
-            num_row -= 1
+        mask = np.abs(array_a) > tol
+        nonzero_row = np.flatnonzero(mask if array_a.ndim == 1 else mask.any(axis=1))
+        num_row = nonzero_row[-1] + 1 if nonzero_row.size != 0 else 0
         array_a = array_a[:num_row]
-    # Cut off zero rows
+    # Cut off zero columns (checked from right to left)
     if remove_zero_col:
         if array_a.ndim == 2:
-            # Check zero columns from right to left
-            col_m = array_a.shape[1]
-            for array_v in array_a.T[::-1]:
-                if any(abs(i) > tol for i in array_v):
-                    break
-                col_m -= 1
-            # Cut off zero columns
+            nonzero_col = np.flatnonzero((np.abs(array_a) > tol).any(axis=0))
+            col_m = nonzero_col[-1] + 1 if nonzero_col.size != 0 else 0
             array_a = array_a[:, :col_m]
     return array_a
 
@@ -273,9 +339,11 @@ def compute_error(
 
     """
     # transform matrix A to either AT or SAT
-    a_trans = np.dot(a, t) if s is None else np.dot(np.dot(s, a), t)
-    # subtract matrix B and compute Frobenius norm squared
-    return np.linalg.norm(a_trans - b, ord=None) ** 2
+    a_trans = np.dot(a, t) if s is None else multi_dot([s, a, t])
+    # subtract matrix B and compute Frobenius norm squared; summing the squared
+    # residual directly skips the sqrt-then-square round trip of norm(...) ** 2
+    diff = a_trans - b
+    return np.einsum("ij,ij->", diff, diff)
 
 
 def setup_input_arrays(
@@ -429,6 +497,10 @@ def _setup_input_array_lower(
         # Sometimes arrays already have zero padding that messes up zero padding below.
     array_a = _hide_zero_padding(array_a, remove_zero_col, remove_zero_row)
     if translate:
+        # fused translation & scaling avoids an extra full-matrix temporary
+        if scale:
+            array_a, _, _ = _translate_scale_array(array_a, array_ref, weight)
+            return array_a
         array_a, _ = _translate_array(array_a, array_ref, weight)
     # scale the matrix when translate is False, but weight is True
     else: